@@ -1,3 +1,4 @@
+from dataclasses import fields
 from typing import Dict, Iterator, Optional
 
 from redis import Redis
@@ -21,9 +22,13 @@ class RedisMessageBroker(AbstractMessageBroker):
     def publish(
         self, channel: str, message: Message, schedule: int = 0
     ) -> None:
-        msg = message.__dict__
+        msg = {
+            field.name: getattr(message, field.name)
+            for field in fields(message)
+            # doesn't make sense to be recreated
+            if field.name != "raised_at"
+        }
         msg["schedule"] = schedule
-        del msg["raised_at"]  # doesn't make sense to be recreated
         self._redis.publish(channel, json_dumps(msg))
 
     def subscribe(self, *channels: str) -> Iterator[Optional[Dict]]:
@@ -71,7 +71,8 @@ class MessageBus(AbstractMessageBus):
             try:
                 for warning in handler(event) or ():
                     yield warning
-                self._queue.extend(self._uow.collect_new_events())
+                for events in self._uow.collect_new_events():
+                    self._queue.extend(events)
             except Exception as ex:
                 logger.exception("Exception handling event %s: %s", event, ex)
                 # raise
@@ -82,7 +83,8 @@ class MessageBus(AbstractMessageBus):
             handler = self._command_handlers[type(command)]
             for warning in handler(command) or ():
                 yield warning
-            self._queue.extend(self._uow.collect_new_events())
+            for events in self._uow.collect_new_events():
+                self._queue.extend(events)
         except Exception as ex:
             logger.exception("Exception handling command %s: %s", command, ex)
             raise
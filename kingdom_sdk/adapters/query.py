@@ -1,5 +1,7 @@
+from functools import lru_cache
 from typing import Any, Dict, Tuple
 
+from jinja2 import Template
 from jinjasql import JinjaSql
 from sqlalchemy.engine import CursorResult
 
@@ -10,21 +12,30 @@ from kingdom_sdk.ports.query import (
 from kingdom_sdk.ports.unit_of_work import AbstractUnitOfWork
 
 
+@lru_cache(maxsize=None)
+def _load_template(jinja: JinjaSql, sql_file_path: str) -> Template:
+    """Read and compile a SQL template only once per process."""
+    with open(sql_file_path) as sql_file:
+        template: Template = jinja.env.from_string(sql_file.read())
+    return template
+
+
 class JinjaTemplateSqlMixin(AbstractTemplateSQLMixin):
     _jinja = JinjaSql(param_style="named")
 
     _sql_file_path: str
 
     def _build_statement(self, **params: Any) -> Tuple[str, Dict]:
-        with open(self._sql_file_path) as sql_file:
-            file_content = sql_file.read()
-        query, bind_params = self._jinja.prepare_query(file_content, params)
+        template = _load_template(self._jinja, self._sql_file_path)
+        query, bind_params = self._jinja.prepare_query(template, params)
         return query, bind_params
 
 
 class DQLInterface(AbstractDQLInterface, JinjaTemplateSqlMixin):
     def __init__(self, sql_file_path: str) -> None:
         self._sql_file_path = sql_file_path
+        # Load it beforehand, so missing files fail on construction
+        _load_template(self._jinja, sql_file_path)
 
     def execute(
         self, uow: AbstractUnitOfWork, commit: bool = False, **params: Any
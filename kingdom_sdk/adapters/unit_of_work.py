@@ -1,23 +1,51 @@
 from abc import ABC
-from typing import Any, Generator, Iterator, List, Set, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.sql.elements import TextClause
 
 from kingdom_sdk import config
+from kingdom_sdk.database.types import SessionFactory_T
 from kingdom_sdk.domain.aggregate import Aggregate
 from kingdom_sdk.domain.exception import KingdomError
+from kingdom_sdk.domain.message import Event
 from kingdom_sdk.ports.unit_of_work import AbstractUnitOfWork
 
-DEFAULT_SESSION_FACTORY = sessionmaker(
-    # ISOLATION LEVEL ENSURES aggregate's version IS RESPECTED
-    # That is, if version differs it will raise an exception
-    bind=create_engine(
-        config.get_database_url(),
-        isolation_level="REPEATABLE_READ",
-    ),
-    autoflush=False,
-)
+
+@lru_cache(maxsize=None)
+def default_session_factory() -> sessionmaker:
+    """Return the session factory bound to the default database.
+
+    The engine and its connection pool are created on the first call and
+    shared by every unit of work that doesn't inject its own factory.
+    """
+    return sessionmaker(
+        # ISOLATION LEVEL ENSURES aggregate's version IS RESPECTED
+        # That is, if version differs it will raise an exception
+        bind=create_engine(
+            config.get_database_url(),
+            isolation_level="REPEATABLE_READ",
+            pool_size=config.get_database_pool_size(),
+            max_overflow=config.get_database_max_overflow(),
+            pool_recycle=config.get_database_pool_recycle(),
+            pool_pre_ping=True,
+        ),
+        autoflush=False,
+    )
+
+
+@lru_cache(maxsize=None)
+def scoped_session_factory() -> scoped_session:
+    """Return a thread-local registry over the default session factory.
+
+    Units of work sharing it reuse the same session, and its identity map,
+    on the same thread. The session isn't closed when a unit of work exits,
+    so call its remove() method when the scope ends, e.g. on the request
+    teardown. Don't use it to share sessions between coroutines.
+    """
+    return scoped_session(default_session_factory())
 
 
 class SQLAlchemyUnitOfWork(AbstractUnitOfWork, ABC):
@@ -27,17 +55,37 @@ class SQLAlchemyUnitOfWork(AbstractUnitOfWork, ABC):
 
     >>> class MyUnitOfWork(SQLAlchemyUnitOfWork):
     ...     repository: ...
+
+    If no session factory is given, the default one is used, so prefer
+    injecting it on tests or when connecting to another database. Inject a
+    scoped_session to reuse the session between units of work.
     """
 
     _errors: List[Any]
-    _session_factory: sessionmaker
+    _session_factory: SessionFactory_T
     _session: Session
+    _repositories: Tuple[Tuple[str, Any], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Python 3.10+ doesn't inherit __annotations__, so look them up in
+        # the MRO like the instance attribute lookup used to do
+        annotations = next(
+            klass.__dict__["__annotations__"]
+            for klass in cls.__mro__
+            if "__annotations__" in klass.__dict__
+        )
+        cls._repositories = tuple(
+            (field, module)
+            for field, module in annotations.items()
+            if not field.startswith("_")
+        )
 
     def __init__(
-        self, session_factory: sessionmaker = DEFAULT_SESSION_FACTORY
+        self, session_factory: Optional[SessionFactory_T] = None
     ) -> None:
         self._errors = []
-        self._session_factory = session_factory
+        self._session_factory = session_factory or default_session_factory()
 
     def __enter__(self) -> AbstractUnitOfWork:
         self._session = self._session_factory()
@@ -46,7 +94,8 @@ class SQLAlchemyUnitOfWork(AbstractUnitOfWork, ABC):
 
     def __exit__(self, *args: Any) -> None:
         super().__exit__(*args)
-        self._session.close()
+        if not isinstance(self._session_factory, scoped_session):
+            self._session.close()
 
     def _commit(self) -> None:
         self._session.commit()
@@ -55,35 +104,51 @@ class SQLAlchemyUnitOfWork(AbstractUnitOfWork, ABC):
         self._session.rollback()
 
     def execute_native_statement(self, statement: str, **params: Any) -> Any:
-        return self._session.execute(statement, params)
+        return self._session.execute(_text_clause(statement), params)
 
-    def collect_new_events(self) -> Generator:
-        dirty: Set[Aggregate] = set()
+    def collect_new_events(
+        self, batch: int = 128
+    ) -> Generator[List[Event], None, None]:
+        if batch < 1:
+            raise ValueError("The batch size must be, at least, 1")
+
+        # Keyed by identity, so aggregates' __hash__ and __eq__ aren't called
+        dirty: Dict[int, Aggregate] = {}
 
         for field_name, _ in self._repositories:
             try:
-                repository = self.__dict__[field_name]
-            except KeyError as error:
-                raise RepositoryNotIntializedError(str(error))
+                repository = getattr(self, field_name)
+            except AttributeError as error:
+                raise RepositoryNotIntializedError(field_name) from error
 
             if hasattr(repository, "_seen"):
-                dirty = dirty.union(repository._seen)  # noqa
-
-        for aggregate in dirty:
-            while aggregate.has_events:
-                yield aggregate.next_event
+                dirty.update(
+                    (id(aggregate), aggregate)
+                    for aggregate in repository._seen  # noqa
+                )
+
+        events: List[Event] = []
+        for aggregate in dirty.values():
+            events.extend(aggregate.drain_events())
+            if len(events) >= batch:
+                yield events
+                events = []
+        if events:
+            yield events
 
     def _initialize_repositories(self, session: Session) -> None:
         for field_name, repository in self._repositories:
-            self.__dict__[field_name] = repository(session)
+            setattr(self, field_name, repository(session))
 
-    @property
-    def _repositories(self) -> Iterator[Tuple[str, Any]]:
-        return (
-            (field, module)
-            for field, module in self.__annotations__.items()
-            if not field.startswith("_")
-        )
+
+@lru_cache(maxsize=256)
+def _text_clause(statement: str) -> TextClause:
+    """Parse the bind parameters of a native statement only once.
+
+    Building text() runs a regex over the statement to find its bind
+    parameters, so repeated statements reuse the already parsed clause.
+    """
+    return text(statement)
 
 
 class RepositoryNotIntializedError(KingdomError):
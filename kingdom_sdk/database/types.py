@@ -2,8 +2,10 @@ from typing import Callable, Union
 from uuid import UUID
 
 from sqlalchemy import MetaData, Table
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 PrimaryKey_T = Union[int, str, UUID]
 TableFactory_T = Callable[[MetaData], Table]
+SessionFactory_T = Union[sessionmaker, scoped_session]
 
-__all__ = ["PrimaryKey_T", "TableFactory_T"]
+__all__ = ["PrimaryKey_T", "TableFactory_T", "SessionFactory_T"]
@@ -35,6 +35,11 @@ class Aggregate(Entity, ABC):
     def next_event(self) -> Event:
         return self._events.pop(0)
 
+    def drain_events(self) -> List[Event]:
+        """Remove and return all the pending events, in the raised order."""
+        events, self._events = self._events, []
+        return events
+
     @property
     def events(self) -> List[Event]:
         return self._events
@@ -27,6 +27,9 @@ class Entity(ABC):
     _registered_at: datetime
     _updated_at: datetime
 
+    # Indexed by the discarded flag when building the representation
+    _REPR_PREFIXES = ("", "**DISCARDED** ")
+
     def __init__(
         self,
         id: UUID,  # noqa
@@ -53,13 +56,11 @@ class Entity(ABC):
         >>> def __repr__(...) -> str:
         ...     return self._base_repr(...)
         """
-        pairs = ", ".join([f"{key}={value}" for key, value in kwargs.items()])
-        return "{prefix}<{classname} '{identifier}'{extra}>".format(
-            prefix="**DISCARDED** " if self.is_discarded else "",
-            classname=self.__class__.__name__,
-            identifier=identifier,
-            extra=f" ({pairs})" if kwargs else "",
-        )
+        prefix = Entity._REPR_PREFIXES[self._is_discarded]
+        if not kwargs:
+            return f"{prefix}<{type(self).__name__} '{identifier}'>"
+        pairs = ", ".join(f"{key}={value}" for key, value in kwargs.items())
+        return f"{prefix}<{type(self).__name__} '{identifier}' ({pairs})>"
 
     @abstractmethod
     def __repr__(self) -> str:
@@ -105,7 +106,7 @@ class Entity(ABC):
 
     def _update(self) -> None:
         self._version += 1
-        self._updated_at = time.generate_now()
+        self._updated_at = time.current_now()
 
     def discard(self) -> None:
         """By convention, isn't necessary delete an object, only mark it as
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Tuple, Type
 from uuid import UUID
 
 from kingdom_sdk.domain.value_object import ValueObject
@@ -21,6 +23,8 @@ class Message(ValueObject, ABC):
         delay: ...
     """
 
+    __slots__ = ()
+
     raised_at: datetime
     delay: int
 
@@ -38,6 +42,8 @@ class Command(Message, ABC):
     ...         ...
     """
 
+    __slots__ = ()
+
 
 @dataclass(frozen=True)
 class Event(Message, ABC):
@@ -55,6 +61,8 @@ class Event(Message, ABC):
         raised_by: The originating aggregate root id.
     """
 
+    __slots__ = ()
+
     raised_by: UUID
 
 
@@ -69,9 +77,35 @@ class PersistentMessage(ValueObject):
         return cls(
             module=message.__class__.__module__,
             classname=message.__class__.__name__,
-            data=asdict(message),
+            data=_message_data(message),
         )
 
     def load_object(self) -> Message:
-        cls = loader.object_from_module(self.module, self.classname)
-        return cls(**self.data)  # type: ignore
+        cls = _message_class(self.module, self.classname)
+        return cls(**self.data)
+
+
+def _message_data(message: Message) -> Dict[str, Any]:
+    """Return the constructor arguments of a message.
+
+    Unlike dataclasses.asdict, the values aren't deep copied, so the data can
+    be given back to the constructor as it is.
+    """
+    names, getter = _data_accessors(message.__class__)
+    return dict(zip(names, getter(message)))
+
+
+@lru_cache(maxsize=None)
+def _data_accessors(
+    cls: Type[Message],
+) -> Tuple[Tuple[str, ...], Callable[[Message], Tuple[Any, ...]]]:
+    # Every message has at least raised_at and delay, so the getter always
+    # returns a tuple.
+    names = tuple(field.name for field in fields(cls) if field.init)
+    return names, attrgetter(*names)
+
+
+@lru_cache(maxsize=None)
+def _message_class(module: str, classname: str) -> Type[Message]:
+    cls: Type[Message] = loader.object_from_module(module, classname)
+    return cls
@@ -18,8 +18,13 @@ class ValueObject(ABC):
     ...     @classmethod
     ...     def create(cls, ...) -> MyClass:
     ...         ...
+
+    The base classes don't have an instance dictionary, so on Python 3.10+ you
+    can declare it with @dataclass(frozen=True, slots=True) to save memory.
     """
 
+    __slots__ = ()
+
     @classmethod
     def create(cls, **kwargs: Any) -> ValueObject:
         raise NotImplementedError
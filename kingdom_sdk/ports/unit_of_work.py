@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Generator
+from typing import Any, Generator, List
+
+from kingdom_sdk.domain.message import Event
 
 
 class AbstractUnitOfWork(ABC):
@@ -30,5 +32,11 @@ class AbstractUnitOfWork(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def collect_new_events(self) -> Generator:
+    def collect_new_events(
+        self, batch: int = 128
+    ) -> Generator[List[Event], None, None]:
+        """Yield the new events in lists of, at least, batch events.
+
+        Only the last list may be smaller.
+        """
         raise NotImplementedError
@@ -1,10 +1,43 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from typing import Iterator, Optional
 
 import pytz
 
 from kingdom_sdk import config
 
+_batch_now: ContextVar[Optional[datetime]] = ContextVar(
+    "batch_now", default=None
+)
+
 
 def generate_now() -> datetime:
     tz = pytz.timezone(config.get_timezone_region())
     return datetime.now(tz)
+
+
+def current_now() -> datetime:
+    """Return the batch timestamp, if inside batch_now(), else generate it."""
+    return _batch_now.get() or generate_now()
+
+
+@contextmanager
+def batch_now() -> Iterator[datetime]:
+    """Freeze the timestamp returned by current_now() inside the block.
+
+    Use it on batch updates, so every entity shares the same timestamp.
+    Entities created inside the block must take registered_at from
+    current_now() too, otherwise their update would be dated before their
+    registration.
+
+    >>> with time.batch_now():
+    ...     for entity in entities:
+    ...         entity.update()
+    """
+    now = generate_now()
+    token = _batch_now.set(now)
+    try:
+        yield now
+    finally:
+        _batch_now.reset(token)
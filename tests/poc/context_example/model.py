@@ -46,7 +46,7 @@ class ExampleEntity(Entity):
         Keyword Args:
             name (str): ...
         """
-        now = time.generate_now()
+        now = time.current_now()
         return cls(
             id=uuid4(),
             version=0,
@@ -103,7 +103,7 @@ class ExampleAggregate(Aggregate):
             value (float): ...
             reference (ExampleEntity): ...
         """
-        now = time.generate_now()
+        now = time.current_now()
         new = cls(
             id=uuid4(),
             version=0,
@@ -1,6 +1,8 @@
-from dataclasses import FrozenInstanceError, is_dataclass
+import sys
+from dataclasses import FrozenInstanceError, dataclass, is_dataclass
 from datetime import datetime
-from uuid import UUID
+from unittest.mock import patch
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -41,10 +43,30 @@ class TestEvent:
         with pytest.raises(FrozenInstanceError):
             example_event.name = "Changed!"
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots need 3.10+"
+    )
+    def test_slotted_event(self):
+        @dataclass(frozen=True, slots=True)
+        class SlottedEvent(Event):
+            name: str
+
+        event = SlottedEvent(
+            raised_at=datetime.now(), delay=0, raised_by=uuid4(), name="slot"
+        )
+        assert not hasattr(event, "__dict__")
+        assert event.name == "slot"
+
 
 class TestPersistentMessage:
     def test_persistent_command(self, example_command):
         pm = PersistentMessage.create(example_command)
+        assert pm.data == {
+            "raised_at": example_command.raised_at,
+            "delay": 0,
+            "value": 1.0,
+            "name": "raised",
+        }
         obj = pm.load_object()
         assert obj == example_command
 
@@ -52,3 +74,10 @@ class TestPersistentMessage:
         pm = PersistentMessage.create(example_event)
         obj = pm.load_object()
         assert obj == example_event
+
+    def test_load_object_imports_once(self, example_event):
+        pm = PersistentMessage.create(example_event)
+        pm.load_object()
+        with patch("kingdom_sdk.utils.loader.import_module") as mocked:
+            assert pm.load_object() == example_event
+        mocked.assert_not_called()
@@ -3,6 +3,8 @@ from dataclasses import FrozenInstanceError
 import pytest
 
 from kingdom_sdk.domain.entity import EntityDiscardedError
+from kingdom_sdk.utils import time
+from tests.poc.context_example.model import ExampleEntity
 
 
 class TestEntity:
@@ -23,6 +25,40 @@ class TestEntity:
         assert example_entity.updated_at > example_entity.registered_at
         assert example_entity.version == last_version + 1
 
+    def test_entity_batch_update(self, example_entity):
+        other_entity = ExampleEntity.create(name="other")
+
+        with time.batch_now() as now:
+            example_entity.update()
+            other_entity.update()
+
+        assert example_entity.updated_at == now
+        assert other_entity.updated_at == now
+
+    def test_entity_create_and_update_in_batch(self):
+        with time.batch_now() as now:
+            entity = ExampleEntity.create(name="batched")
+            entity.update()
+
+        assert entity.registered_at == now
+        assert entity.updated_at == now
+        assert entity.version == 1
+
+    def test_entity_repr(self, example_entity):
+        identifier = example_entity.id.hex
+        assert repr(example_entity) == f"<ExampleEntity '{identifier}'>"
+        assert (
+            example_entity._base_repr(identifier, name="created")  # noqa
+            == f"<ExampleEntity '{identifier}' (name=created)>"
+        )
+
+        example_entity.discard()
+
+        assert (
+            repr(example_entity)
+            == f"**DISCARDED** <ExampleEntity '{identifier}'>"
+        )
+
     def test_entity_discard(self, example_entity):
         assert not example_entity.is_discarded
 
@@ -53,6 +89,13 @@ class TestAggregate:
         assert example_aggregate.updated_at > example_aggregate.registered_at
         assert example_aggregate.version == last_version + 1
 
+    def test_aggregate_drain_events(self, example_aggregate):
+        events = example_aggregate.events[:]
+
+        assert example_aggregate.drain_events() == events
+        assert not example_aggregate.has_events
+        assert example_aggregate.drain_events() == []
+
     def test_aggregate_discard(self, example_aggregate):
         assert not example_aggregate.is_discarded
 
@@ -0,0 +1,46 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from kingdom_sdk.adapters.query import DQLInterface, JinjaTemplateSqlMixin
+
+
+class TestDQLInterface:
+    def test_build_statement_missing_params(self, query_path):
+        query = DQLInterface(query_path)
+        statement, bind_params = query._build_statement(id="1")  # noqa
+        assert "ilike" not in statement
+        assert bind_params == {"id_1": "1"}
+
+    def test_build_statement_full_params(self, query_path):
+        query = DQLInterface(query_path)
+        statement, bind_params = query._build_statement(  # noqa
+            id="1", name="%a%"
+        )
+        assert "ilike" in statement
+        assert bind_params == {"id_1": "1", "name_2": "%a%"}
+
+    def test_build_statement_reads_file_once(self, query_path):
+        query = DQLInterface(query_path)
+        query._build_statement(id="1")  # noqa
+        with patch("builtins.open") as mocked_open:
+            query._build_statement(id="2")  # noqa
+            DQLInterface(query_path)._build_statement(id="3")  # noqa
+        mocked_open.assert_not_called()
+
+    def test_template_missing_file(self, poc_dir):
+        with pytest.raises(FileNotFoundError):
+            DQLInterface(os.path.join(poc_dir, "missing.sql"))
+
+
+class TestJinjaTemplateSqlMixin:
+    def test_build_statement_from_file_path(self, query_path):
+        class PathOnlyQuery(JinjaTemplateSqlMixin):
+            _sql_file_path = query_path
+
+        statement, bind_params = PathOnlyQuery()._build_statement(  # noqa
+            id="1"
+        )
+        assert "ilike" not in statement
+        assert bind_params == {"id_1": "1"}
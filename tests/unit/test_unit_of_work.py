@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from kingdom_sdk.adapters.unit_of_work import (
+    RepositoryNotIntializedError,
+    default_session_factory,
+    scoped_session_factory,
+)
+from tests.poc.context_example.model import ExampleAggregate
+from tests.poc.context_example.repository import PocRepository
+from tests.poc.context_example.unit_of_work import PocUnitOfWork
+
+
+@pytest.fixture
+def default_scoped_session():
+    session_factory = scoped_session_factory()
+    yield session_factory
+    session_factory.remove()
+
+
+class TestUnitOfWork:
+    def test_repositories_from_annotations(self):
+        assert PocUnitOfWork._repositories == (  # noqa
+            ("repository", PocRepository),
+        )
+
+    def test_repositories_inherited(self):
+        class InheritedUnitOfWork(PocUnitOfWork):
+            pass
+
+        assert InheritedUnitOfWork._repositories == (  # noqa
+            ("repository", PocRepository),
+        )
+
+        uow = InheritedUnitOfWork(MagicMock())
+        with uow:
+            assert isinstance(uow.repository, PocRepository)
+
+    def test_collect_events_not_initialized(self):
+        uow = PocUnitOfWork()
+        with pytest.raises(RepositoryNotIntializedError):
+            list(uow.collect_new_events())
+
+    def test_default_session_factory_shared(self):
+        assert default_session_factory() is default_session_factory()
+        assert PocUnitOfWork()._session_factory is default_session_factory()
+
+    def test_injected_session_factory(self):
+        session_factory = MagicMock()
+        uow = PocUnitOfWork(session_factory)
+        assert uow._session_factory is session_factory
+
+    def test_scoped_session_reused(self):
+        session_factory = scoped_session(
+            sessionmaker(bind=create_engine("sqlite://"))
+        )
+        uow = PocUnitOfWork(session_factory)
+
+        with uow:
+            first_session = uow._session
+        with uow:
+            second_session = uow._session
+
+        assert first_session is second_session
+        session_factory.remove()
+
+    def test_collect_new_events(self, example_aggregate):
+        uow = PocUnitOfWork(MagicMock())
+        events = example_aggregate.events[:]
+
+        with uow:
+            uow.repository.add(example_aggregate)
+            assert list(uow.collect_new_events()) == [events]
+            assert list(uow.collect_new_events()) == []
+
+    def test_collect_new_events_batches(self, example_entity):
+        uow = PocUnitOfWork(MagicMock())
+        aggregates = [
+            ExampleAggregate.create(value=1.0, reference=example_entity)
+            for _ in range(5)
+        ]
+
+        with uow:
+            for aggregate in aggregates:
+                uow.repository.add(aggregate)
+            batches = list(uow.collect_new_events(batch=2))
+
+        assert [len(events) for events in batches] == [2, 2, 1]
+
+        with pytest.raises(ValueError):
+            next(uow.collect_new_events(batch=0))
+
+    def test_execute_native_statement(self):
+        uow = PocUnitOfWork(sessionmaker(bind=create_engine("sqlite://")))
+
+        with uow:
+            first = uow.execute_native_statement("SELECT :value", value=1)
+            second = uow.execute_native_statement("SELECT :value", value=2)
+            assert first.scalar() == 1
+            assert second.scalar() == 2
+
+    def test_scoped_session_factory_shared(self):
+        session_factory = scoped_session_factory()
+        assert session_factory is scoped_session_factory()
+        assert session_factory.session_factory is default_session_factory()
+
+    def test_scoped_session_not_closed(self, default_scoped_session):
+        session = default_scoped_session()
+        uow = PocUnitOfWork(default_scoped_session)
+
+        with patch.object(session, "close") as mocked_close:
+            with uow:
+                assert uow._session is session
+
+        mocked_close.assert_not_called()
+        assert default_scoped_session() is session
@@ -85,6 +85,16 @@ class TestTime:
     def test_generate_now(self):
         assert isinstance(time.generate_now(), datetime)
 
+    def test_current_now(self):
+        assert isinstance(time.current_now(), datetime)
+
+    def test_batch_now(self):
+        with time.batch_now() as outer_now:
+            assert time.current_now() == outer_now
+            with time.batch_now() as inner_now:
+                assert time.current_now() == inner_now
+            assert time.current_now() == outer_now
+
 
 class TestSerializer:
     def test_serialize_decimal(self):